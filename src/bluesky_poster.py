@@ -1,12 +1,26 @@
 """BlueSky social media poster with rate limiting and post tracking."""
 
 import logging
+import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, Any, Tuple, Optional, List
 from blueskysocial import Client, Post, WebCard
 from storage import Story, PostStatus
 
 
+@lru_cache(maxsize=1)
+def _now_cached(ttl_hash: int) -> datetime:
+    """Return datetime.now(), memoized for as long as ttl_hash stays the same."""
+    del ttl_hash
+    return datetime.now()
+
+
+def _now() -> datetime:
+    """Current time, fetched at most once per wall-clock second."""
+    return _now_cached(int(time.time()))
+
+
 class BlueSkyPoster:
     """Handles posting stories to BlueSky with rate limiting and tracking."""
 
@@ -27,6 +41,7 @@ class BlueSkyPoster:
         # Extract rate limiting configuration
         rate_limit_config = config.get("rate_limit", {})
         self.post_interval_minutes = rate_limit_config.get("post_interval_minutes", 30)
+        self.post_interval = timedelta(minutes=self.post_interval_minutes)
         self.client: Optional[Client] = None
 
         # Initialize BlueSky client
@@ -85,13 +100,12 @@ class BlueSkyPoster:
         if self.last_successful_post_time is None:
             return True, "No previous posts"
 
-        time_since_last_post = datetime.now() - self.last_successful_post_time
-        required_interval = timedelta(minutes=self.post_interval_minutes)
+        time_since_last_post = _now() - self.last_successful_post_time
 
-        if time_since_last_post >= required_interval:
+        if time_since_last_post >= self.post_interval:
             return True, f"Sufficient time elapsed: {time_since_last_post}"
 
-        remaining = required_interval - time_since_last_post
+        remaining = self.post_interval - time_since_last_post
         return False, f"Rate limit active, {remaining} remaining"
 
     def post_story(self, story: Story) -> Tuple[PostStatus, str]:
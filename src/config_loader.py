@@ -5,6 +5,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one when PyYAML was built without libyaml.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_yaml(path: str) -> Dict[str, Any]:
     """
@@ -28,7 +31,7 @@ def load_yaml(path: str) -> Dict[str, Any]:
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_SafeLoader)
             if data is None:
                 data = {}
             result = cast(Dict[str, Any], data)
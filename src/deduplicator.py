@@ -1,11 +1,36 @@
 import logging
 import hashlib
 from typing import List, Dict, Set, Tuple
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlsplit, parse_qs
 from storage import Story
 
 logger = logging.getLogger(__name__)
 
+# Common tracking parameters stripped from URLs before hashing
+_TRACKING_PARAMS = frozenset(
+    {
+        "utm_source",
+        "utm_medium",
+        "utm_campaign",
+        "utm_term",
+        "utm_content",
+        "fbclid",
+        "gclid",
+        "msclkid",
+        "ref",
+        "source",
+        "campaign_id",
+        "_ga",
+        "_gac",
+        "_gid",
+        "mc_cid",
+        "mc_eid",
+    }
+)
+
+# Quote characters that vary between sources for the same headline
+_HEADLINE_QUOTES = str.maketrans("", "", "\"'")
+
 
 class StoryDeduplicator:
     """Handles deduplication of news stories using URL and headline hashes."""
@@ -20,31 +45,11 @@ class StoryDeduplicator:
         Normalize URL for deduplication by removing tracking parameters and fragments.
         """
         try:
-            parsed = urlparse(url)
-
-            # Remove common tracking parameters
-            tracking_params = {
-                "utm_source",
-                "utm_medium",
-                "utm_campaign",
-                "utm_term",
-                "utm_content",
-                "fbclid",
-                "gclid",
-                "msclkid",
-                "ref",
-                "source",
-                "campaign_id",
-                "_ga",
-                "_gac",
-                "_gid",
-                "mc_cid",
-                "mc_eid",
-            }
+            parsed = urlsplit(url)
 
             if parsed.query:
                 params = parse_qs(parsed.query)
-                filtered_params = {k: v for k, v in params.items() if k not in tracking_params}
+                filtered_params = {k: v for k, v in params.items() if k not in _TRACKING_PARAMS}
                 query_string = "&".join(f"{k}={v[0]}" for k, v in filtered_params.items())
             else:
                 query_string = ""
@@ -67,9 +72,7 @@ class StoryDeduplicator:
         normalized = " ".join(headline.lower().split())
 
         # Remove common punctuation that might vary
-        punctuation_to_remove = ['"', "'", '"', '"', """, """]
-        for punct in punctuation_to_remove:
-            normalized = normalized.replace(punct, "")
+        normalized = normalized.translate(_HEADLINE_QUOTES).replace(", ", "")
 
         # Remove trailing punctuation that might vary
         normalized = normalized.rstrip(".,!?;:")
@@ -96,21 +99,14 @@ class StoryDeduplicator:
         """
         logger.info("Loading %d existing stories for deduplication", len(existing_stories))
 
-        self.url_hashes.clear()
-        self.headline_hashes.clear()
-        self.existing_story_ids.clear()
-
-        for story in existing_stories:
-            # Add story ID
-            self.existing_story_ids.add(story.story_id)
-
-            # Add URL hash (skip Google News redirects as they're not reliable)
-            if not self._is_google_news_redirect(story.url):
-                url_hash = self._get_url_hash(story.url)
-                self.url_hashes.add(url_hash)
-            # Add headline hash
-            headline_hash = self._get_headline_hash(story.title)
-            self.headline_hashes.add(headline_hash)
+        self.existing_story_ids = {story.story_id for story in existing_stories}
+        # Skip Google News redirects as they're not reliable
+        self.url_hashes = {
+            self._get_url_hash(story.url)
+            for story in existing_stories
+            if not self._is_google_news_redirect(story.url)
+        }
+        self.headline_hashes = {self._get_headline_hash(story.title) for story in existing_stories}
 
         logger.info(
             "Deduplication index loaded: %d URL hashes, %d headline hashes, %d story IDs",
@@ -1,11 +1,37 @@
 import logging
-from typing import List, Dict, Any
+import sys
+from collections import Counter
+from functools import lru_cache
+from typing import Callable, List, Dict, Any, FrozenSet, Optional, Tuple
+from keyword_matcher import find_keywords, get_matcher, normalize_keywords
 from storage import Story, FilterStatus
 from typechecking import as_str_key_dict
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _lower_source(source: str) -> str:
+    """Lowercase and intern a source name, cached since the same outlets recur across every batch."""
+    return sys.intern(source.lower())
+
+
+def _matches_sources(
+    source: str, source_lower: str, exact: FrozenSet[str], sources_lower: List[Tuple[str, str]], source_type: str
+) -> bool:
+    """Check a source against one configured list: an exact name first, then a substring scan."""
+    if source_lower in exact:
+        logger.debug("Source '%s' is a configured %s source", source, source_type)
+        return True
+
+    for configured_lower, configured_source in sources_lower:
+        if configured_lower in source_lower:
+            logger.debug("Source '%s' matches %s source '%s'", source, source_type, configured_source)
+            return True
+
+    return False
+
+
 class StoryFilter:
     """Filters news stories based on source, headline, and URL criteria."""
 
@@ -16,12 +42,27 @@ class StoryFilter:
         # Source filtering
         self.confirmed_sources = set(filter_config.get("confirmed_sources", []))
         self.accepted_sources = set(filter_config.get("accepted_sources", []))
+        # Lowercased (and interned, so exact lookups can match on identity) once here rather than
+        # per source per story in is_source_allowed
+        self._confirmed_sources_lower = [(_lower_source(source), source) for source in self.confirmed_sources]
+        self._accepted_sources_lower = [(_lower_source(source), source) for source in self.accepted_sources]
+        # Exact (case-insensitive) names, checked before falling back to the substring scans
+        self._confirmed_exact = frozenset(lower for lower, _ in self._confirmed_sources_lower)
+        self._accepted_exact = frozenset(lower for lower, _ in self._accepted_sources_lower)
+        # Replace is_source_allowed with a version that skips unconfigured source lists
+        specialized_checker = self._build_source_checker()
+        if specialized_checker is not None:
+            self.is_source_allowed = specialized_checker  # type: ignore[assignment]
 
         # Keyword filtering
-        self.banned_headline_keywords = [
-            keyword.lower() for keyword in filter_config.get("banned_headline_keywords", [])
-        ]
-        self.banned_url_keywords = [keyword.lower() for keyword in filter_config.get("banned_url_keywords", [])]
+        self.banned_headline_keywords = list(
+            normalize_keywords(tuple(filter_config.get("banned_headline_keywords", [])))
+        )
+        self.banned_url_keywords = list(normalize_keywords(tuple(filter_config.get("banned_url_keywords", []))))
+
+        # One matcher per keyword list, so each text is scanned once regardless of keyword count
+        self._headline_matcher = get_matcher(self.banned_headline_keywords)
+        self._url_matcher = get_matcher(self.banned_url_keywords)
 
         logger.info(
             "Initialized StoryFilter with %d confirmed sources, %d accepted sources, %d banned headline keywords, %d banned URL keywords",
@@ -47,23 +88,57 @@ class StoryFilter:
             logger.debug("Empty source provided")
             return False, "empty"
 
-        source_lower = source.lower()
+        source_lower = _lower_source(source)
 
-        # Check confirmed sources (exact match, case-insensitive)
-        for confirmed_source in self.confirmed_sources:
-            if confirmed_source.lower() in source_lower:
-                logger.debug("Source '%s' matches confirmed source '%s'", source, confirmed_source)
-                return True, "confirmed"
+        if _matches_sources(source, source_lower, self._confirmed_exact, self._confirmed_sources_lower, "confirmed"):
+            return True, "confirmed"
 
-        # Check accepted sources (exact match, case-insensitive)
-        for accepted_source in self.accepted_sources:
-            if accepted_source.lower() in source_lower:
-                logger.debug("Source '%s' matches accepted source '%s'", source, accepted_source)
-                return True, "accepted"
+        # Accepted sources only apply once no confirmed source matched, even as a substring
+        if _matches_sources(source, source_lower, self._accepted_exact, self._accepted_sources_lower, "accepted"):
+            return True, "accepted"
 
         logger.debug("Source '%s' not found in confirmed or accepted sources", source)
         return False, "banned"
 
+    def _build_source_checker(self) -> Optional[Callable[[str], tuple[bool, str]]]:
+        """
+        Build an is_source_allowed specialized to the configured source lists.
+
+        Returns:
+            A checker that skips the empty list(s) entirely, or None when both lists are configured
+            and the general is_source_allowed applies.
+        """
+        if self.confirmed_sources and self.accepted_sources:
+            return None
+
+        def reject(source: str) -> tuple[bool, str]:
+            logger.debug("Source '%s' not found in confirmed or accepted sources", source)
+            return False, "banned"
+
+        if self.confirmed_sources:
+            exact, sources_lower, source_type = self._confirmed_exact, self._confirmed_sources_lower, "confirmed"
+        elif self.accepted_sources:
+            exact, sources_lower, source_type = self._accepted_exact, self._accepted_sources_lower, "accepted"
+        else:
+
+            def no_sources(source: str) -> tuple[bool, str]:
+                if not source:
+                    logger.debug("Empty source provided")
+                    return False, "empty"
+                return reject(source)
+
+            return no_sources
+
+        def single_list(source: str) -> tuple[bool, str]:
+            if not source:
+                logger.debug("Empty source provided")
+                return False, "empty"
+            if _matches_sources(source, _lower_source(source), exact, sources_lower, source_type):
+                return True, source_type
+            return reject(source)
+
+        return single_list
+
     def has_banned_headline_keywords(self, headline: str) -> tuple[bool, List[str]]:
         """
         Check if headline contains banned keywords.
@@ -71,15 +146,10 @@ class StoryFilter:
         Returns:
             tuple: (has_banned_keywords, list_of_found_keywords)
         """
-        if not headline:
+        if not headline or self._headline_matcher is None:
             return False, []
 
-        headline_lower = headline.lower()
-        found_keywords: List[str] = []
-
-        for banned_keyword in self.banned_headline_keywords:
-            if banned_keyword in headline_lower:
-                found_keywords.append(banned_keyword)
+        found_keywords = sorted(find_keywords(self._headline_matcher, headline.lower()))
 
         if found_keywords:
             logger.debug("Headline '%s' contains banned keywords: %s", headline, found_keywords)
@@ -94,15 +164,10 @@ class StoryFilter:
         Returns:
             tuple: (has_banned_keywords, list_of_found_keywords)
         """
-        if not url:
+        if not url or self._url_matcher is None:
             return False, []
 
-        url_lower = url.lower()
-        found_keywords: List[str] = []
-
-        for banned_keyword in self.banned_url_keywords:
-            if banned_keyword in url_lower:
-                found_keywords.append(banned_keyword)
+        found_keywords = sorted(find_keywords(self._url_matcher, url.lower()))
 
         if found_keywords:
             logger.debug("URL '%s' contains banned keywords: %s", url, found_keywords)
@@ -165,13 +230,12 @@ class StoryFilter:
 
         logger.info("Starting to process %d stories for filtering", len(stories))
 
-        filter_stats: Dict[str, Any] = {
-            "total": len(stories),
-            "passed": 0,
-            "filtered_out": 0,
-            "reasons": {},
-            "source_types": {"confirmed": 0, "accepted": 0},
-        }
+        # Accumulate into locals and build the stats dict once after the loop
+        total = len(stories)
+        passed = 0
+        filtered_out = 0
+        reasons: Counter[str] = Counter()
+        source_types: Counter[str] = Counter()
 
         for i, story in enumerate(stories, 1):
             try:
@@ -181,41 +245,38 @@ class StoryFilter:
                     # Story passed all filters
                     story.filter_status = FilterStatus.passed
                     story.filter_reason = reason
-                    filter_stats["passed"] += 1
+                    passed += 1
 
                     # Count source types for passed stories
-                    source_type = metadata.get("source_type", "unknown")
-                    if source_type in filter_stats["source_types"]:
-                        filter_stats["source_types"][source_type] += 1
+                    source_types[metadata.get("source_type", "unknown")] += 1
                 else:
                     # Story was filtered out
                     story.filter_status = FilterStatus.rejected
                     story.filter_reason = reason
-                    filter_stats["filtered_out"] += 1
+                    filtered_out += 1
 
                     # Count reasons for filtering out
-                    reason_key = reason.split(":", maxsplit=1)[0]  # Get the main reason category
-                    if reason_key in filter_stats["reasons"]:
-                        filter_stats["reasons"][reason_key] += 1
-                    else:
-                        filter_stats["reasons"][reason_key] = 1
+                    reasons[reason.split(":", maxsplit=1)[0]] += 1  # Get the main reason category
 
-                logger.debug(
-                    "Processed story %d/%d: %s... [%s]", i, len(stories), story.title[:50], story.filter_status
-                )
+                logger.debug("Processed story %d/%d: %s... [%s]", i, total, story.title[:50], story.filter_status)
 
             except Exception as e:
                 logger.error("Error filtering story %d: %s", i, e)
                 logger.debug("Story data: %s", story)
                 story.filter_status = FilterStatus.error
                 story.filter_reason = "Processing error: %s" % str(e)
-                filter_stats["filtered_out"] += 1
-                if "error" in filter_stats["reasons"]:
-                    filter_stats["reasons"]["error"] += 1
-                else:
-                    filter_stats["reasons"]["error"] = 1
+                filtered_out += 1
+                reasons["error"] += 1
                 continue
 
+        filter_stats: Dict[str, Any] = {
+            "total": total,
+            "passed": passed,
+            "filtered_out": filtered_out,
+            "reasons": dict(reasons),
+            "source_types": {"confirmed": source_types["confirmed"], "accepted": source_types["accepted"]},
+        }
+
         logger.info("Filtering complete: %d/%d stories passed", filter_stats["passed"], filter_stats["total"])
         logger.info(
             "Source breakdown: %d confirmed, %d accepted",
@@ -0,0 +1,72 @@
+"""
+Shared keyword matching for the story filter and the relevance checker.
+
+Matches many lowercased keywords against a text in one scan, using an Aho-Corasick automaton when
+pyahocorasick is installed and a compiled alternation regex otherwise.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Pattern, Set, Tuple, Union
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; keyword matching falls back to a compiled regex
+    ahocorasick = None  # type: ignore[assignment]
+
+# Without pyahocorasick, a compiled alternation plus, for each keyword, the keywords that are prefixes of it
+KeywordMatcher = Union["ahocorasick.Automaton", Tuple[Pattern[str], Dict[str, FrozenSet[str]]]]
+
+# Matchers are immutable once built, so instances configured with the same keywords share one
+_MATCHER_CACHE: Dict[Tuple[str, ...], KeywordMatcher] = {}
+
+
+@lru_cache(maxsize=128)
+def normalize_keywords(keywords: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Lowercase a configured keyword list, keeping its order; cached since instances share the same config."""
+    return tuple(keyword.lower() for keyword in keywords)
+
+
+def get_matcher(keywords: Iterable[str]) -> Optional[KeywordMatcher]:
+    """
+    Return a cached matcher for any of the lowercased keywords, or None if there are none.
+
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise a single alternation regex.
+    Empty keywords are dropped, since they would match every text.
+    """
+    key = tuple(sorted({keyword.lower() for keyword in keywords if keyword}))
+    if not key:
+        return None
+    matcher = _MATCHER_CACHE.get(key)
+    if matcher is None:
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in key:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            matcher = automaton
+        else:
+            # Zero-width lookahead so overlapping keywords are all found; longest alternatives first so
+            # each position reports its longest keyword, whose prefix set covers the shorter ones there
+            alternation = "|".join(re.escape(keyword) for keyword in sorted(key, key=len, reverse=True))
+            keyword_set = set(key)
+            prefixes = {
+                keyword: frozenset(keyword[:end] for end in range(1, len(keyword) + 1)) & keyword_set
+                for keyword in key
+            }
+            matcher = (re.compile(f"(?=({alternation}))"), prefixes)
+        _MATCHER_CACHE[key] = matcher
+    return matcher
+
+
+def find_keywords(matcher: KeywordMatcher, text_lower: str) -> Set[str]:
+    """Return the set of keywords that occur in the already-lowercased text."""
+    if isinstance(matcher, tuple):
+        # Any keyword starting where a longer one matched is a prefix of it ("rumor" in "rumors"),
+        # so the hits' prefix sets give the same result as the automaton in one pass
+        pattern, prefixes = matcher
+        found: Set[str] = set()
+        for hit in set(pattern.findall(text_lower)):
+            found |= prefixes[hit]
+        return found
+    return {keyword for _, keyword in matcher.iter(text_lower)}
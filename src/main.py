@@ -25,17 +25,10 @@ def merge_story_with_existing(storage: RedisStorage, story: Story) -> tuple[str,
     Returns ('saved'|'updated'|'error', error_message_or_None)
     """
     try:
-        if storage.story_exists(story.story_id):
-            existing = storage.get_story(story.story_id)
-            if existing:
-                # Only update filter fields, preserve advanced fields                existing.filter_status = story.filter_status
-                existing.filter_reason = story.filter_reason
-                storage.update_story(existing)
-                logger.debug("Merged filter status into existing story: %s", story.story_id)
-                return "updated", None
-            else:
-                logger.warning("Story exists but could not be loaded: %s", story.story_id)
-                return "error", "Story exists but could not be loaded: %s" % story.story_id
+        # Only update filter fields, preserve advanced fields
+        if storage.update_fields(story.story_id, filter_status=story.filter_status, filter_reason=story.filter_reason):
+            logger.debug("Merged filter status into existing story: %s", story.story_id)
+            return "updated", None
 
         storage.save_story(story)
         logger.debug("Saved new story: %s", story.story_id)
@@ -394,13 +387,13 @@ def run_once() -> None:
 
                 # Get source types for each story (from filter results)
                 source_types: Dict[str, str] = {}
+                story_filter_temp = StoryFilter(config)
                 for story in stories_to_summarize:
                     # Determine source type based on filter metadata
                     # If the story passed filtering, we need to check its source type
                     source_type = "accepted"  # Default to accepted
 
                     # Check if story is from confirmed source by re-running source check
-                    story_filter_temp = StoryFilter(config)
                     is_allowed, detected_source_type = story_filter_temp.is_source_allowed(story.source)
                     if is_allowed and detected_source_type == "confirmed":
                         source_type = "confirmed"
@@ -464,11 +457,10 @@ def run_once() -> None:
                     posting_stats["skipped"],
                     posting_stats["rate_limited"],
                 )  # Update stories in storage with posting results
-                updated_count = 0
-                for story in postable_stories:
-                    if story.post_status:  # Only update if post status was set
-                        storage.update_story(story)
-                        updated_count += 1
+                # Only update if post status was set; written back in a single pipelined round-trip
+                posted_results = [story for story in postable_stories if story.post_status]
+                storage.save_stories(posted_results)
+                updated_count = len(posted_results)
 
                 if updated_count > 0:
                     logger.info("Updated %d stories with posting results", updated_count)
@@ -7,6 +7,7 @@ Confirmed sources automatically pass relevance checks.
 
 import logging
 from typing import Dict, Any, List, Tuple
+from keyword_matcher import find_keywords, get_matcher, normalize_keywords
 from storage import Story, RelevanceStatus
 
 logger = logging.getLogger(__name__)
@@ -20,9 +21,10 @@ class RelevanceChecker:
         relevance_config = config.get("relevance_checker", {})
         
         # Get relevance keywords
-        self.keywords = [
-            keyword.lower() for keyword in relevance_config.get("keywords", [])
-        ]
+        self.keywords = list(normalize_keywords(tuple(relevance_config.get("keywords", []))))
+        
+        # Shared with any StoryFilter/RelevanceChecker configured with the same keywords
+        self._matcher = get_matcher(self.keywords)
         
         # Get strategy (currently only 'substring' is supported)
         self.strategy = relevance_config.get("strategy", "substring")
@@ -77,13 +79,9 @@ class RelevanceChecker:
             logger.warning("Story %s has no summary or title to check relevance", story.story_id)
             return False, "No text available for relevance checking"
         
-        text_lower = text_to_check.lower()
-        matched_keywords: List[str] = []
-        
-        # Check each keyword
-        for keyword in self.keywords:
-            if keyword in text_lower:
-                matched_keywords.append(keyword)
+        found = set() if self._matcher is None else find_keywords(self._matcher, text_to_check.lower())
+        # Report matches in configured order
+        matched_keywords: List[str] = [keyword for keyword in self.keywords if keyword in found]
         
         if matched_keywords:
             reason = f"Matched relevance keywords: {', '.join(matched_keywords)}"
@@ -119,8 +117,7 @@ class RelevanceChecker:
             is_relevant, reason = self.is_relevant(story, source_type)
             
             # Update story with relevance information
-            story.relevance_status = RelevanceStatus.relevant if is_relevant else RelevanceStatus.not_relevant
-            story.relevance_reason = reason
+            story.set_relevance(RelevanceStatus.relevant if is_relevant else RelevanceStatus.not_relevant, reason)
             
             processed_stories.append(story)
             
@@ -1,7 +1,8 @@
 
 from enum import Enum
 import json
-from typing import Any, Dict, Optional, List, cast
+from typing import Any, Dict, Iterable, Optional, List, cast
+import msgpack
 from pydantic import BaseModel
 import redis
 from typechecking import as_int
@@ -116,6 +117,21 @@ class Story(BaseModel):
     posted_at: Optional[str] = None  # ISO timestamp when successfully posted
     # Add more fields as needed
 
+    def set_relevance(self, status: RelevanceStatus, reason: str) -> None:
+        """
+        Record the outcome of a relevance check.
+
+        Writes both fields straight into the model's field storage, skipping BaseModel.__setattr__
+        dispatch; the values are already of the declared types.
+
+        Args:
+            status (RelevanceStatus): The relevance status to record.
+            reason (str): Why the story was judged relevant or not.
+        """
+        self.__dict__["relevance_status"] = status
+        self.__dict__["relevance_reason"] = reason
+        self.__pydantic_fields_set__.update(("relevance_status", "relevance_reason"))
+
 class RedisStorage:
     """
     RedisStorage provides an interface for storing, retrieving, updating, and deleting Story objects in a Redis database.
@@ -124,13 +140,17 @@ class RedisStorage:
         url (str): The Redis connection URL. Defaults to "redis://localhost:6379/0".
     Methods:
         save_story(story: Story) -> None:
-            Save a Story object to Redis, serializing its fields as JSON.
+            Save a Story object to Redis as a single msgpack blob.
+        save_stories(stories: Iterable[Story]) -> None:
+            Save multiple Story objects in a single pipelined round-trip.
         get_story(story_id: str) -> Optional[Story]:
             Retrieve a Story object from Redis by its ID.
         story_exists(story_id: str) -> bool:
             Check if a story with the given ID exists in Redis.
         update_story(story: Story) -> None:
             Update an existing Story object in Redis.
+        update_fields(story_id: str, **fields: Any) -> bool:
+            Overwrite individual fields of a stored story without revalidating it.
         get_all_stories() -> List[Story]:
             Retrieve all Story objects stored in Redis.
         get_story_count() -> int:
@@ -148,10 +168,10 @@ class RedisStorage:
 
     def save_story(self, story: Story) -> None:
         """
-        Saves a Story object to Redis as a hash.
+        Saves a Story object to Redis as a msgpack blob.
 
-        Each field of the Story is serialized to JSON for consistency, then stored as a string
-        in a Redis hash with a key formatted as "story:{story_id}".
+        The Story is dumped in JSON mode (enums as plain strings), packed with msgpack and
+        stored with a single SET under a key formatted as "story:{story_id}".
 
         Args:
             story (Story): The Story object to be saved.
@@ -159,9 +179,30 @@ class RedisStorage:
         Returns:
             None
         """
-        # Serialize each field as JSON for consistency
-        data =  {str(k): json.dumps(v) for k, v in story.model_dump().items()}
-        self.client.hset(f"story:{story.story_id}", mapping=data) #type: ignore
+        self.client.set(f"story:{story.story_id}", self._serialize(story))
+
+    def save_stories(self, stories: Iterable[Story]) -> None:
+        """
+        Saves multiple Story objects to Redis in one MULTI/EXEC pipeline.
+
+        Each story is stored exactly as save_story would store it, but all writes are sent
+        in a single round-trip instead of one per story.
+
+        Args:
+            stories (Iterable[Story]): The Story objects to be saved.
+
+        Returns:
+            None
+        """
+        pipe = self.client.pipeline()
+        for story in stories:
+            pipe.set(f"story:{story.story_id}", self._serialize(story))
+        pipe.execute()
+
+    @staticmethod
+    def _serialize(story: Story) -> bytes:
+        """Pack the story's fields into a msgpack blob."""
+        return cast(bytes, msgpack.packb(story.model_dump(mode="json")))
 
     def get_story(self, story_id: str) -> Optional[Story]:
         """
@@ -173,7 +214,19 @@ class RedisStorage:
         Returns:
             Optional[Story]: The Story object if found, otherwise None.
         """
-        result = cast(Dict[bytes, bytes], self.client.hgetall(f"story:{story_id}")) #type: ignore
+        key = f"story:{story_id}"
+        try:
+            raw = cast(Optional[bytes], self.client.get(key))
+        except redis.ResponseError:
+            # WRONGTYPE: the story was saved before the msgpack format, as a hash of JSON fields
+            return self._get_legacy_story(key)
+        if raw is None:
+            return None
+        return Story(**msgpack.unpackb(raw))
+
+    def _get_legacy_story(self, key: str) -> Optional[Story]:
+        """Read a story stored in the old format: a hash with each field serialized as JSON."""
+        result = cast(Dict[bytes, bytes], self.client.hgetall(key)) #type: ignore
         if not result:
             return None
         data: Dict[str, Any] = {k.decode(): json.loads(v) for k, v in result.items()}
@@ -206,18 +259,67 @@ class RedisStorage:
         """
         self.save_story(story)
 
+    def update_fields(self, story_id: str, **fields: Any) -> bool:
+        """
+        Overwrites individual fields of a stored story without building a Story model.
+
+        The stored blob is unpacked to a plain dict, the given fields are replaced and the blob
+        is written back, skipping the Pydantic validation of a get_story/update_story round-trip.
+
+        Args:
+            story_id (str): The unique identifier of the story to update.
+            **fields: Story field names mapped to their new values.
+
+        Returns:
+            bool: True if the story existed and was updated, False if it was not found.
+
+        Raises:
+            ValueError: If any of the field names is not a Story field.
+        """
+        unknown = fields.keys() - Story.model_fields.keys()
+        if unknown:
+            raise ValueError(f"Unknown Story fields: {sorted(unknown)}")
+
+        key = f"story:{story_id}"
+        try:
+            raw = cast(Optional[bytes], self.client.get(key))
+        except redis.ResponseError:
+            # Legacy hash format: go through the model once, which also rewrites it as a blob
+            story = self._get_legacy_story(key)
+            if story is None:
+                return False
+            self.save_story(story.model_copy(update=fields))
+            return True
+        if raw is None:
+            return False
+
+        data: Dict[str, Any] = msgpack.unpackb(raw)
+        # Store enum members by value, matching model_dump(mode="json")
+        data.update({k: v.value if isinstance(v, Enum) else v for k, v in fields.items()})
+        self.client.set(key, msgpack.packb(data))
+        return True
+
     def get_all_stories(self) -> List[Story]:
         """
         Retrieves all stories stored in the database.
 
+        Keys are collected with SCAN and every blob is fetched with a single MGET. Keys that
+        MGET cannot return (legacy hash-format stories) are loaded individually.
+
         Returns:
             List[Story]: A list of all Story objects found in the storage.
         """
-        keys: List[bytes] = self.client.keys("story:*") #type: ignore
+        keys: List[bytes] = list(self.client.scan_iter(match="story:*", count=1000))
+        if not keys:
+            return []
+        raws = cast(List[Optional[bytes]], self.client.mget(keys))
         stories: List[Story] = []
-        for key in keys:
-            story_id = key.decode().split(":", 1)[1]
-            story = self.get_story(story_id)
+        for key, raw in zip(keys, raws):
+            if raw is not None:
+                stories.append(Story(**msgpack.unpackb(raw)))
+                continue
+            # Not a string value: a legacy hash, or deleted since the scan
+            story = self.get_story(key.decode().split(":", 1)[1])
             if story:
                 stories.append(story)
         return stories
@@ -11,7 +11,7 @@ Implements the summarization strategy defined in the PRD:
 """
 
 import logging
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, Callable
 
 from openai import OpenAI, AuthenticationError
 from storage import Story
@@ -22,7 +22,7 @@ logger = logging.getLogger(__name__)
 class Summarizer:
     """Generate summaries for news articles using OpenAI with fallback strategies."""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], openai_factory: Optional[Callable[..., OpenAI]] = None):
         """
         Initialize summarizer with configuration.
 
@@ -32,17 +32,19 @@ class Summarizer:
                 - max_length: Maximum summary length (default: 300)
                 - retry_count: Number of retries for over-length summaries (default: 2)
                 - model: OpenAI model to use (default: gpt-4o-mini)
+            openai_factory: Callable used to build the OpenAI client from api_key (default: OpenAI)
         """
         self.config = config
         self.max_length = config.get("max_length", 300)
         self.retry_count = config.get("retry_count", 2)
         self.model = config.get("model", "gpt-4o-mini")
         self.client: Optional[OpenAI] = None
+        openai_factory = openai_factory or OpenAI
 
         # Initialize OpenAI client if available
         try:
 
-            self.client = OpenAI(api_key=config["api_key"])
+            self.client = openai_factory(api_key=config["api_key"])
             models = self.client.models.list()  # Test API key validity
             # Check if the model is available
             if self.model not in [model.id for model in models.data]:
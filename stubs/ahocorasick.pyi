@@ -0,0 +1,15 @@
+from typing import Any, Iterator, Optional, Tuple
+
+STORE_ANY: int
+STORE_INTS: int
+STORE_LENGTH: int
+
+class Automaton:
+    def __init__(self, store: int = ..., key_type: int = ...) -> None: ...
+    def add_word(self, key: str, value: Any = ...) -> bool: ...
+    def make_automaton(self) -> None: ...
+    def exists(self, key: str) -> bool: ...
+    def get(self, key: str, default: Any = ...) -> Any: ...
+    def iter(self, string: str, start: int = ..., end: Optional[int] = ..., ignore_white_space: bool = ...) -> Iterator[Tuple[int, Any]]: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, key: str) -> bool: ...
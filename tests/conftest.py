@@ -1,5 +1,70 @@
-import sys
-import os
+import pytest
 
-# Add the src directory to sys.path for all tests
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+from storage import Story
+
+
+@pytest.fixture
+def reset_mock_template():
+    """Return a function that readies a module-cached mock template for the current test.
+
+    The template is reset rather than copied: a shallow copy of a mock shares its child
+    mocks, and with them their call history.
+    """
+
+    def _reset(template, **attributes):
+        template.reset_mock(return_value=True, side_effect=True)
+        template.configure_mock(**attributes)
+        return template
+
+    return _reset
+
+
+@pytest.fixture
+def regex_keyword_backend(monkeypatch):
+    """Match keywords with the regex fallback, as when pyahocorasick is not installed."""
+    monkeypatch.setattr("keyword_matcher.ahocorasick", None)
+    # Fresh cache so no automaton built by an earlier test is reused
+    monkeypatch.setattr("keyword_matcher._MATCHER_CACHE", {})
+
+
+@pytest.fixture(scope="module")
+def basic_story():
+    """A summarized story template shared by tests that only read it."""
+    return Story(
+        story_id="1",
+        title="Test News",
+        url="https://example.com/1",
+        date="2025-06-20",
+        source="Test Source",
+        summary="This is a test summary.",
+    )
+
+
+@pytest.fixture
+def story_factory(basic_story):
+    """Return variants of basic_story; model_copy skips re-running Story validation."""
+
+    def _make(**overrides):
+        return basic_story.model_copy(update=overrides)
+
+    return _make
+
+
+@pytest.fixture
+def story_set(story_factory):
+    """Return a list of n distinct numbered stories, e.g. story_set(3) -> "News 1".."News 3"."""
+
+    def _make(n, **overrides):
+        return [
+            story_factory(
+                story_id=str(i),
+                title=f"News {i}",
+                url=f"https://example.com/{i}",
+                source=f"Source {i}",
+                summary=f"Summary {i}",
+                **overrides,
+            )
+            for i in range(1, n + 1)
+        ]
+
+    return _make
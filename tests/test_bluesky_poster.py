@@ -1,412 +1,249 @@
 """Test cases for the BlueSkyPoster class."""
 
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, create_autospec
 from datetime import datetime, timedelta
 
+import pytest
+from blueskysocial import Client
+from freezegun import freeze_time
+
 from bluesky_poster import BlueSkyPoster
-from storage import Story, PostStatus
+from storage import PostStatus
 
+CREDENTIALS = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
+RATE_LIMIT = {"rate_limit": {"post_interval_minutes": 30}}
 
-class TestBlueSkyPoster:
-    """Test cases for the BlueSkyPoster class."""
+FROZEN_NOW = datetime(2025, 6, 20, 12, 0, 0)
+FIVE_MINUTES_AGO = FROZEN_NOW - timedelta(minutes=5)
+THIRTY_ONE_MINUTES_AGO = FROZEN_NOW - timedelta(minutes=31)
 
-    def test_initialization(self):
-        """Test BlueSky poster initialization with configuration."""
-        config = {
-            "bluesky": {"handle": "test.bsky.social", "app_password": "test-password"},
-            "rate_limit": {"post_interval_minutes": 30},
-        }
 
-        poster = BlueSkyPoster(config)
+@pytest.fixture(scope="module")
+def _client_template():
+    """Build the autospec'd BlueSky client once per module."""
+    return create_autospec(Client, instance=True)
+
+
+@pytest.fixture(autouse=True)
+def mock_bluesky_client(_client_template, reset_mock_template, monkeypatch):
+    """Reset the cached client mock and install it as bluesky_poster.Client for every test.
 
-        assert poster.handle == "test.bsky.social"
-        assert poster.app_password == "test-password"
-        assert poster.post_interval_minutes == 30
-        assert poster.client is not None
-        assert not poster.authenticated
+    Autouse so no test in this module can construct a real BlueSky client.
+    """
+    # Default to a client that authenticates and posts successfully
+    client = reset_mock_template(_client_template, **{"authenticate.return_value": None, "post.return_value": True})
+    monkeypatch.setattr("bluesky_poster.Client", lambda *args, **kwargs: client)
+    return client
 
-    def test_initialization_empty_config(self):
-        """Test BlueSky poster initialization with empty configuration."""
-        config = {}
 
+@pytest.fixture
+def poster_factory():
+    """Build a BlueSkyPoster from a config, optionally marked as already authenticated."""
+
+    def _make(config, authenticated=False):
         poster = BlueSkyPoster(config)
+        if authenticated:
+            poster.authenticated = True  # Skip auth for this test
+        return poster
+
+    return _make
 
-        assert poster.handle == ""
-        assert poster.app_password == ""
-        assert poster.post_interval_minutes == 30  # default
-        assert poster.client is None
 
-    @patch("bluesky_poster.Client")
-    def test_authenticate_success(self, mock_client_class):
-        """Test successful authentication."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
+def test_initialization(poster_factory):
+    """Test BlueSky poster initialization with configuration."""
+    poster = poster_factory({**CREDENTIALS, **RATE_LIMIT})
 
-        # Mock the client instance
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.return_value = None  # No exception means success
+    assert poster.handle == "test.bsky.social"
+    assert poster.app_password == "test-password"
+    assert poster.post_interval_minutes == 30
+    assert poster.post_interval == timedelta(minutes=30)
+    assert poster.client is not None
+    assert not poster.authenticated
 
-        poster = BlueSkyPoster(config)
-        result = poster.authenticate()
 
-        assert result is True
-        assert poster.authenticated is True
-        mock_client.authenticate.assert_called_once_with("test.bsky.social", "test-password")
+def test_initialization_empty_config(poster_factory):
+    """Test BlueSky poster initialization with empty configuration."""
+    poster = poster_factory({})
 
-    @patch("bluesky_poster.Client")
-    def test_authenticate_failure(self, mock_client_class):
-        """Test failed authentication."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "wrong-password"}}
+    assert poster.handle == ""
+    assert poster.app_password == ""
+    assert poster.post_interval_minutes == 30  # default
+    assert poster.client is None
 
-        # Mock the client instance to raise an exception
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.side_effect = Exception("Auth failed")
 
-        poster = BlueSkyPoster(config)
-        result = poster.authenticate()
+def test_authenticate_success(mock_bluesky_client, poster_factory):
+    """Test successful authentication."""
+    poster = poster_factory(CREDENTIALS)
+    result = poster.authenticate()
 
-        assert result is False
-        assert poster.authenticated is False
+    assert result is True
+    assert poster.authenticated is True
+    mock_bluesky_client.authenticate.assert_called_once_with("test.bsky.social", "test-password")
 
-    def test_authenticate_no_credentials(self):
-        """Test authentication with missing credentials."""
-        config = {"bluesky": {"handle": "", "app_password": ""}}
 
-        poster = BlueSkyPoster(config)
-        result = poster.authenticate()
+def test_authenticate_failure(mock_bluesky_client, poster_factory):
+    """Test failed authentication."""
+    # Make the client raise on authentication
+    mock_bluesky_client.authenticate.side_effect = Exception("Auth failed")
 
-        assert result is False
-        assert poster.authenticated is False
+    poster = poster_factory({"bluesky": {"handle": "test.bsky.social", "app_password": "wrong-password"}})
+    result = poster.authenticate()
 
-    def test_can_post_now_no_previous_posts(self):
-        """Test rate limiting when there are no previous posts."""
-        config = {"rate_limit": {"post_interval_minutes": 30}}
+    assert result is False
+    assert poster.authenticated is False
 
-        poster = BlueSkyPoster(config)
 
-        can_post, reason = poster.can_post_now()
+def test_authenticate_no_credentials(poster_factory):
+    """Test authentication with missing credentials."""
+    poster = poster_factory({"bluesky": {"handle": "", "app_password": ""}})
+    result = poster.authenticate()
 
-        assert can_post is True
-        assert "No previous posts" in reason
+    assert result is False
+    assert poster.authenticated is False
 
-    def test_can_post_now_sufficient_time_elapsed(self):
-        """Test rate limiting when sufficient time has elapsed."""
-        config = {"rate_limit": {"post_interval_minutes": 30}}
 
-        poster = BlueSkyPoster(config)
+@freeze_time(FROZEN_NOW)
+@pytest.mark.parametrize(
+    "last_post_time, expected_can_post, reason_substring",
+    [
+        (None, True, "No previous posts"),
+        (THIRTY_ONE_MINUTES_AGO, True, "Sufficient time elapsed"),
+        (FIVE_MINUTES_AGO, False, "Rate limit active"),
+    ],
+    ids=["no_previous_posts", "sufficient_time_elapsed", "rate_limited"],
+)
+def test_can_post_now(poster_factory, last_post_time, expected_can_post, reason_substring):
+    """Test rate limiting decisions relative to the last successful post."""
+    poster = poster_factory(RATE_LIMIT)
+    poster.last_successful_post_time = last_post_time
 
-        # Set last post time to 31 minutes ago
-        poster.last_successful_post_time = datetime.now() - timedelta(minutes=31)
+    can_post, reason = poster.can_post_now()
 
-        can_post, reason = poster.can_post_now()
+    assert can_post is expected_can_post
+    assert reason_substring in reason
 
-        assert can_post is True
-        assert "Sufficient time elapsed" in reason
 
-    def test_can_post_now_rate_limited(self):
-        """Test rate limiting when not enough time has elapsed."""
-        config = {"rate_limit": {"post_interval_minutes": 30}}
+@freeze_time(FROZEN_NOW)
+@pytest.mark.parametrize(
+    "summary, post_side_effect, last_post_time, expected_status, expected_reason, expected_post_calls",
+    [
+        ("This is a test summary.", None, None, PostStatus.posted, "Posted successfully", 1),
+        ("This is a test summary.", Exception("Post failed"), None, PostStatus.failed, "Post failed", 1),
+        (None, None, None, PostStatus.failed, "No summary available", 0),
+        ("A" * 350, None, None, PostStatus.posted, "Posted successfully", 1),  # Over 300 chars
+        ("This is a test summary.", None, FIVE_MINUTES_AGO, PostStatus.skipped, "Rate limited", 0),
+    ],
+    ids=["success", "failure", "no_summary", "too_long", "rate_limited"],
+)
+def test_post_story(
+    mock_bluesky_client,
+    poster_factory,
+    story_factory,
+    summary,
+    post_side_effect,
+    last_post_time,
+    expected_status,
+    expected_reason,
+    expected_post_calls,
+):
+    """Test the outcome of posting a single story."""
+    mock_bluesky_client.post.side_effect = post_side_effect
 
-        poster = BlueSkyPoster(config)
+    poster = poster_factory({**CREDENTIALS, **RATE_LIMIT}, authenticated=True)
+    poster.last_successful_post_time = last_post_time
 
-        # Set last post time to 5 minutes ago
-        poster.last_successful_post_time = datetime.now() - timedelta(minutes=5)
+    story = story_factory(summary=summary)
 
-        can_post, reason = poster.can_post_now()
+    status, reason = poster.post_story(story)
 
-        assert can_post is False
-        assert "Rate limit active" in reason
+    assert status == expected_status
+    assert expected_reason in reason
+    # A Post object is only handed to the client when posting is attempted
+    assert mock_bluesky_client.post.call_count == expected_post_calls
+    if expected_post_calls:
+        mock_bluesky_client.post.assert_called_once_with(ANY)  # the Post object
 
-    @patch("bluesky_poster.Client")
-    def test_post_story_success(self, mock_client_class):
-        """Test successful story posting."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
 
-        # Mock the client
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.return_value = None
-        mock_client.post.return_value = True
+@freeze_time(FROZEN_NOW)
+@pytest.mark.parametrize("n_stories", [2, 3, 5])
+def test_post_stories_rate_limit_short_circuits(mock_bluesky_client, poster_factory, story_set, n_stories):
+    """Test that post_stories stops after the first successful post."""
+    poster = poster_factory({**CREDENTIALS, **RATE_LIMIT}, authenticated=True)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True  # Skip auth for this test
-
-        story = Story(
-            story_id="1",
-            title="Test News",
-            url="https://example.com/1",
-            date="2025-06-20",
-            source="Test Source",
-            summary="This is a test summary for posting.",
-        )
-
-        status, reason = poster.post_story(story)
-
-        assert status == PostStatus.posted
-        assert "Posted successfully" in reason
-        # Check that a Post object was created and passed to the client
-        mock_client.post.assert_called_once()
-        call_args = mock_client.post.call_args[0]
-        assert len(call_args) >= 1  # At least one argument (the Post object)
-
-    @patch("bluesky_poster.Client")
-    def test_post_story_failure(self, mock_client_class):
-        """Test failed story posting."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
-
-        # Mock the client to fail posting
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.return_value = None
-        mock_client.post.side_effect = Exception("Post failed")
+    stories = story_set(n_stories)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True
+    stats = poster.post_stories(stories)
 
-        story = Story(
-            story_id="1",
-            title="Test News",
-            url="https://example.com/1",
-            date="2025-06-20",
-            source="Test Source",
-            summary="This is a test summary.",
-        )
+    # Should only post one story due to rate limiting
+    assert stats == {"total": n_stories, "posted": 1, "failed": 0, "skipped": 0, "rate_limited": 0}
+    mock_bluesky_client.post.assert_called_once_with(ANY)
 
-        status, reason = poster.post_story(story)
+    # Check that only the first story was posted
+    assert stories[0].post_status == PostStatus.posted
+    assert stories[0].posted_at == FROZEN_NOW.isoformat()
+    assert all(story.post_status is None for story in stories[1:])  # Not processed
 
-        assert status == PostStatus.failed
-        assert "Post failed" in reason
 
-    def test_post_story_no_summary(self):
-        """Test posting story with no summary."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
+def test_post_stories_posts_once_per_run_when_unlimited(mock_bluesky_client, poster_factory, story_set):
+    """Test that a zero post interval still posts only one story per run."""
+    poster = poster_factory({**CREDENTIALS, "rate_limit": {"post_interval_minutes": 0}}, authenticated=True)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True
-
-        story = Story(
-            story_id="1",
-            title="Test News",
-            url="https://example.com/1",
-            date="2025-06-20",
-            source="Test Source",
-            # No summary
-        )
-
-        status, reason = poster.post_story(story)
-
-        assert status == PostStatus.failed
-        assert "No summary available" in reason
-
-    def test_post_story_too_long(self):
-        """Test posting story that exceeds character limit."""
-        config = {"bluesky": {"handle": "test.bsky.social", "app_password": "test-password"}}
-
-        with patch("bluesky_poster.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value = mock_client
-            mock_client.authenticate.return_value = None
-            mock_client.post.return_value = True
-
-            poster = BlueSkyPoster(config)
-            poster.authenticated = True
-
-            # Create a very long summary (over 300 chars)
-            long_summary = "A" * 350
-
-            story = Story(
-                story_id="1",
-                title="Test News",
-                url="https://example.com/1",
-                date="2025-06-20",
-                source="Test Source",
-                summary=long_summary,
-            )
-
-            status, reason = poster.post_story(story)
-
-            assert status == PostStatus.posted
-            # Check that a Post object was created and passed to the client
-            mock_client.post.assert_called_once()
-            call_args = mock_client.post.call_args[0]
-            assert len(call_args) >= 1  # At least one argument (the Post object)
-
-    def test_post_story_rate_limited(self):
-        """Test posting when rate limited."""
-        config = {"rate_limit": {"post_interval_minutes": 30}}
+    stories = story_set(3)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True
-        poster.last_successful_post_time = datetime.now() - timedelta(minutes=5)
-
-        story = Story(
-            story_id="1",
-            title="Test News",
-            url="https://example.com/1",
-            date="2025-06-20",
-            source="Test Source",
-            summary="Test summary",
-        )
-
-        status, reason = poster.post_story(story)
-
-        assert status == PostStatus.skipped
-        assert "Rate limited" in reason
-
-    @patch("bluesky_poster.Client")
-    def test_post_stories_multiple(self, mock_client_class):
-        """Test posting multiple stories with rate limiting."""
-        config = {
-            "bluesky": {"handle": "test.bsky.social", "app_password": "test-password"},
-            "rate_limit": {"post_interval_minutes": 30},
-        }
-
-        # Mock successful posting
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.return_value = None
-        mock_client.post.return_value = True
+    stats = poster.post_stories(stories)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True
-
-        stories = [
-            Story(
-                story_id="1",
-                title="News 1",
-                url="https://example.com/1",
-                date="2025-06-20",
-                source="Source 1",
-                summary="Summary 1",
-            ),
-            Story(
-                story_id="2",
-                title="News 2",
-                url="https://example.com/2",
-                date="2025-06-20",
-                source="Source 2",
-                summary="Summary 2",
-            ),
-            Story(
-                story_id="3",
-                title="News 3",
-                url="https://example.com/3",
-                date="2025-06-20",
-                source="Source 3",
-                summary="Summary 3",
-            ),
-        ]
-
-        stats = poster.post_stories(stories)
-
-        # Should only post one story due to rate limiting
-        assert stats["total"] == 3
-        assert stats["posted"] == 1
-        assert stats["failed"] == 0
-        assert stats["skipped"] == 0
-        assert stats["rate_limited"] == 0
-
-        # Check that only the first story was posted
-        assert stories[0].post_status == PostStatus.posted
-        assert stories[1].post_status is None  # Not processed
-        assert stories[2].post_status is None  # Not processed
-
-    def test_post_stories_skip_already_posted(self):
-        """Test that already posted stories are skipped."""
-        config = {}
+    assert stats["posted"] == 1
+    mock_bluesky_client.post.assert_called_once_with(ANY)
+    assert all(story.post_status is None for story in stories[1:])
 
-        poster = BlueSkyPoster(config)
 
-        stories = [
-            Story(
-                story_id="1",
-                title="News 1",
-                url="https://example.com/1",
-                date="2025-06-20",
-                source="Source 1",
-                summary="Summary 1",
-                post_status=PostStatus.posted,
-            ),  # Already posted
-            Story(
-                story_id="2",
-                title="News 2",
-                url="https://example.com/2",
-                date="2025-06-20",
-                source="Source 2",
-                summary="Summary 2",
-            ),
-        ]
-
-        stats = poster.post_stories(stories)
-
-        assert stats["total"] == 2
-        assert stats["posted"] == 0
-        assert stats["skipped"] == 1
-
-    def test_set_last_post_time(self):
-        """Test setting the last successful post time."""
-        config = {}
+def test_post_stories_skip_already_posted(poster_factory, story_set):
+    """Test that already posted stories are skipped."""
+    poster = poster_factory({})
 
-        poster = BlueSkyPoster(config)
+    stories = story_set(2)
+    stories[0].post_status = PostStatus.posted  # Already posted
+
+    stats = poster.post_stories(stories)
 
-        test_time = datetime.now() - timedelta(hours=1)
-        poster.set_last_post_time(test_time)
+    assert stats["total"] == 2
+    assert stats["posted"] == 0
+    assert stats["skipped"] == 1
 
-        assert poster.last_successful_post_time == test_time
 
-    @patch("bluesky_poster.Client")
-    def test_post_stories_rate_limiting_enforcement(self, mock_client_class):
-        """Test that rate limiting is properly enforced in post_stories method."""
-        config = {
-            "bluesky": {"handle": "test.bsky.social", "app_password": "test-password"},
-            "rate_limit": {"post_interval_minutes": 30},
-        }
+def test_set_last_post_time(poster_factory):
+    """Test setting the last successful post time."""
+    poster = poster_factory({})
 
-        # Mock successful posting
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
-        mock_client.authenticate.return_value = None
-        mock_client.post.return_value = True
+    test_time = FROZEN_NOW - timedelta(hours=1)
+    poster.set_last_post_time(test_time)
 
-        poster = BlueSkyPoster(config)
-        poster.authenticated = True
-
-        # Set last post time to 5 minutes ago (within rate limit window)
-        poster.last_successful_post_time = datetime.now() - timedelta(minutes=5)
-
-        stories = [
-            Story(
-                story_id="1",
-                title="News 1",
-                url="https://example.com/1",
-                date="2025-06-20",
-                source="Source 1",
-                summary="Summary 1",
-            ),
-            Story(
-                story_id="2",
-                title="News 2",
-                url="https://example.com/2",
-                date="2025-06-20",
-                source="Source 2",
-                summary="Summary 2",
-            ),
-        ]
-
-        stats = poster.post_stories(stories)
-
-        # Should not post any stories due to rate limiting
-        assert stats["total"] == 2
-        assert stats["posted"] == 0
-        assert stats["failed"] == 0
-        assert stats["skipped"] == 0
-        assert stats["rate_limited"] == 2
-        # Check that both stories were rate limited
-        assert stories[0].post_status == PostStatus.skipped
-        assert stories[0].post_reason and "Rate limited" in stories[0].post_reason
-        assert stories[1].post_status == PostStatus.skipped
-        assert stories[1].post_reason and "Rate limited" in stories[1].post_reason
-
-        # Verify no actual posts were made
-        mock_client.post.assert_not_called()
+    assert poster.last_successful_post_time == test_time
+
+
+@freeze_time(FROZEN_NOW)
+def test_post_stories_rate_limiting_enforcement(mock_bluesky_client, poster_factory, story_set):
+    """Test that rate limiting is properly enforced in post_stories method."""
+    poster = poster_factory({**CREDENTIALS, **RATE_LIMIT}, authenticated=True)
+
+    # Set last post time to 5 minutes ago (within rate limit window)
+    poster.last_successful_post_time = FIVE_MINUTES_AGO
+
+    stories = story_set(2)
+
+    stats = poster.post_stories(stories)
+
+    # Should not post any stories due to rate limiting
+    assert stats["total"] == 2
+    assert stats["posted"] == 0
+    assert stats["failed"] == 0
+    assert stats["skipped"] == 0
+    assert stats["rate_limited"] == 2
+    # Check that both stories were rate limited
+    assert stories[0].post_status == PostStatus.skipped
+    assert stories[0].post_reason and "Rate limited" in stories[0].post_reason
+    assert stories[1].post_status == PostStatus.skipped
+    assert stories[1].post_reason and "Rate limited" in stories[1].post_reason
+
+    # Verify no actual posts were made
+    mock_bluesky_client.post.assert_not_called()
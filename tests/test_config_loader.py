@@ -1,42 +1,48 @@
 
+import pytest
 from config_loader import load_config
 import yaml  # type: ignore
 
 def write_yaml(path, data):
     with open(path, 'w') as f:
-        yaml.dump(data, f)
+        yaml.dump(data, f, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper))
 
-def test_load_config_merges_secrets(tmp_path):
-    config_data = {
+@pytest.fixture(scope='session')
+def yaml_fixtures(tmp_path_factory):
+    """Write every config/secrets file used by this module once, and return their paths by name."""
+    base = tmp_path_factory.mktemp('config_loader')
+    paths = {
+        'merge_config': base / 'merge_config.yaml',
+        'merge_secrets': base / 'merge_secrets.yaml',
+        'simple_config': base / 'simple_config.yaml',
+        'simple_secrets': base / 'simple_secrets.yaml',
+        'missing': base / 'missing.yaml',  # never written
+    }
+    write_yaml(paths['merge_config'], {
         'fetcher': {'lookback_days': 1, 'search_string': 'test', 'language': 'en'},
         'filter': {'confirmed_sources': ['A'], 'accepted_sources': ['B']}
-    }
-    secrets_data = {
+    })
+    write_yaml(paths['merge_secrets'], {
         'fetcher': {'lookback_days': 7},
         'filter': {'confirmed_sources': ['C']},
         'bluesky': {'handle': 'user', 'app_password': 'pw'}
-    }
-    config_path = tmp_path / 'config.yaml'
-    secrets_path = tmp_path / 'secrets.yaml'
-    write_yaml(config_path, config_data)
-    write_yaml(secrets_path, secrets_data)
-    merged = load_config(str(config_path), str(secrets_path))
+    })
+    paths['simple_config'].write_text('foo: bar\n')
+    paths['simple_secrets'].write_text('foo: baz\n')
+    return {name: str(path) for name, path in paths.items()}
+
+def test_load_config_merges_secrets(yaml_fixtures):
+    merged = load_config(yaml_fixtures['merge_config'], yaml_fixtures['merge_secrets'])
     assert merged['fetcher']['lookback_days'] == 7  # secrets override config
     assert merged['filter']['confirmed_sources'] == ['C']
     assert merged['filter']['accepted_sources'] == ['B']
     assert merged['bluesky']['handle'] == 'user'
     assert merged['bluesky']['app_password'] == 'pw'
 
-def test_load_config_missing_secrets(tmp_path):
-    config_data = {'foo': 'bar'}
-    config_path = tmp_path / 'config.yaml'
-    write_yaml(config_path, config_data)
-    merged = load_config(str(config_path), str(tmp_path / 'secrets.yaml'))
+def test_load_config_missing_secrets(yaml_fixtures):
+    merged = load_config(yaml_fixtures['simple_config'], yaml_fixtures['missing'])
     assert merged['foo'] == 'bar'
 
-def test_load_config_missing_config(tmp_path):
-    secrets_data = {'foo': 'baz'}
-    secrets_path = tmp_path / 'secrets.yaml'
-    write_yaml(secrets_path, secrets_data)
-    merged = load_config(str(tmp_path / 'config.yaml'), str(secrets_path))
+def test_load_config_missing_config(yaml_fixtures):
+    merged = load_config(yaml_fixtures['missing'], yaml_fixtures['simple_secrets'])
     assert merged['foo'] == 'baz'
@@ -1,3 +1,8 @@
+"""Tests for GoogleNewsFetcher.
+
+PYTEST_DONT_REWRITE: the asserts here are simple equality checks that don't need rewritten diffs.
+"""
+
 from fetcher import GoogleNewsFetcher
 from storage import Story
 
@@ -6,7 +11,7 @@ def test_fetcher_returns_stories(monkeypatch):
     class MockGoogleNews:
         def __init__(self, lang):
             pass
-        def set_time_range(self, since, until):
+        def set_period(self, period):
             pass
         def search(self, search_string):
             pass
@@ -21,7 +26,7 @@ def test_fetcher_returns_stories(monkeypatch):
                 }
             ]
     monkeypatch.setattr("fetcher.GoogleNews", MockGoogleNews)
-    fetcher = GoogleNewsFetcher(search_string="test", lookback_days=1, language="en")
+    fetcher = GoogleNewsFetcher(search_string="test", period="1D", language="en")
     stories = fetcher.fetch()
     assert len(stories) == 1
     story = stories[0]
@@ -1,8 +1,6 @@
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
+import pytest
 from filter import StoryFilter
+from relevance_checker import RelevanceChecker
 from storage import Story
 
 class TestStoryFilter:
@@ -105,6 +103,43 @@ class TestStoryFilter:
         assert not is_allowed
         assert source_type == "empty"
     
+    def test_is_source_allowed_confirmed_substring_beats_accepted_exact(self):
+        """Test that a confirmed substring match takes precedence over an exact accepted match."""
+        config = {
+            "filter": {
+                "confirmed_sources": ["BBC"],
+                "accepted_sources": ["BBC Sport"],
+            }
+        }
+        
+        filter_obj = StoryFilter(config)
+        
+        assert filter_obj.is_source_allowed("bbc sport") == (True, "confirmed")
+    
+    @pytest.mark.parametrize(
+        "confirmed, accepted, specialized",
+        [
+            (["BBC News"], ["The Guardian"], False),
+            (["BBC News"], [], True),
+            ([], ["The Guardian"], True),
+            ([], [], True),
+        ],
+        ids=["both", "only_confirmed", "only_accepted", "none"],
+    )
+    def test_is_source_allowed_specialized_by_config(self, confirmed, accepted, specialized):
+        """Test that the source checker specialized to the configured lists behaves like the general one."""
+        config = {"filter": {"confirmed_sources": confirmed, "accepted_sources": accepted}}
+        
+        filter_obj = StoryFilter(config)
+        
+        assert ("is_source_allowed" in vars(filter_obj)) is specialized
+        expected_bbc = (True, "confirmed") if confirmed else (False, "banned")
+        expected_guardian = (True, "accepted") if accepted else (False, "banned")
+        assert filter_obj.is_source_allowed("BBC News International") == expected_bbc
+        assert filter_obj.is_source_allowed("the guardian") == expected_guardian
+        assert filter_obj.is_source_allowed("Random Blog") == (False, "banned")
+        assert filter_obj.is_source_allowed("") == (False, "empty")
+    
     def test_has_banned_headline_keywords(self):
         """Test headline keyword filtering."""
         config = {
@@ -135,6 +170,11 @@ class TestStoryFilter:
         assert has_banned
         assert "fake" in keywords
         assert "rumor" in keywords
+
+        # Test a keyword repeated in the headline is reported once
+        has_banned, keywords = filter_obj.has_banned_headline_keywords("Rumor upon rumor")
+        assert has_banned
+        assert keywords == ["rumor"]
         
         # Test empty headline
         has_banned, keywords = filter_obj.has_banned_headline_keywords("")
@@ -358,3 +398,32 @@ class TestStoryFilter:
         assert stats["total"] == 0
         assert stats["passed"] == 0
         assert stats["filtered_out"] == 0
+    
+    def test_keyword_matcher_shared_across_instances(self):
+        """Test that filters configured with the same keywords reuse one matcher."""
+        filter_a = StoryFilter({"filter": {"banned_headline_keywords": ["rumor", "Gossip"]}})
+        filter_b = StoryFilter({"filter": {"banned_headline_keywords": ["gossip", "rumor"]}})
+        checker = RelevanceChecker({"relevance_checker": {"keywords": ["RUMOR", "gossip"]}})
+        
+        assert filter_a._headline_matcher is filter_b._headline_matcher
+        assert checker._matcher is filter_a._headline_matcher
+        assert filter_a._url_matcher is None
+    
+    @pytest.mark.parametrize("use_automaton", [True, False], ids=["automaton", "regex_fallback"])
+    def test_banned_keywords_match_on_both_backends(self, request, use_automaton):
+        """Test keyword matching gives the same result with and without pyahocorasick installed."""
+        if use_automaton:
+            pytest.importorskip("ahocorasick")
+        else:
+            request.getfixturevalue("regex_keyword_backend")
+        config = {"filter": {"banned_headline_keywords": ["rumor", "rumors", "fake", ""]}}
+        
+        filter_obj = StoryFilter(config)
+        
+        has_banned, keywords = filter_obj.has_banned_headline_keywords("FAKE rumors about Chelsea")
+        assert has_banned
+        assert keywords == ["fake", "rumor", "rumors"]  # nested keywords reported, as with the automaton
+        
+        has_banned, keywords = filter_obj.has_banned_headline_keywords("Chelsea wins match")
+        assert not has_banned
+        assert keywords == []
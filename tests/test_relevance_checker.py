@@ -282,3 +282,29 @@ class TestRelevanceChecker:
         # Should still work with substring matching
         assert is_relevant is True
         assert "chelsea" in reason
+    
+    def test_substring_relevance_regex_fallback(self, regex_keyword_backend):
+        """Test substring relevance through the alternation regex used without pyahocorasick."""
+        config = {
+            "relevance_checker": {
+                "keywords": ["Chelsea", "football"],
+                "strategy": "substring"
+            }
+        }
+        
+        checker = RelevanceChecker(config)
+        
+        story = Story(
+            story_id="regex",
+            title="Sports News",
+            url="https://example.com/regex",
+            date="2025-06-20",
+            source="The Guardian",
+            summary="FOOTBALL: Chelsea beat Chelsea's rivals"
+        )
+        
+        is_relevant, reason = checker.is_relevant(story, "accepted")
+        
+        assert is_relevant is True
+        # Each keyword reported once, in configured order
+        assert reason == "Matched relevance keywords: chelsea, football"
@@ -1,19 +1,24 @@
 import os
+import json
 import pytest
-from storage import RedisStorage, Story, PostStatus
+from storage import RedisStorage, Story, PostStatus, FilterStatus
 
 REDIS_URL = os.environ.get("TEST_REDIS_URL", "redis://localhost:6379/1")
 
+def _clear_stories(s):
+    # SCAN walks the keyspace in cursor-sized chunks instead of blocking Redis like KEYS
+    keys = list(s.client.scan_iter(match="story:*", count=500))
+    if keys:
+        s.client.unlink(*keys)
+
 @pytest.fixture(scope="function")
 def storage():
     s = RedisStorage(url=REDIS_URL)
     # Clean up before each test
-    for key in s.client.keys("story:*"):
-        s.client.delete(key)
+    _clear_stories(s)
     yield s
     # Clean up after each test
-    for key in s.client.keys("story:*"):
-        s.client.delete(key)
+    _clear_stories(s)
 
 def test_save_and_get_story(storage):
     story = Story(
@@ -57,21 +62,64 @@ def test_update_story(storage):
         source="Test Source"
     )
     storage.save_story(story)
-    updated = story.model_copy(update={"title": "New Title"})
-    storage.update_story(updated)
+    story.title = "New Title"
+    storage.update_story(story)
     loaded = storage.get_story("update1")
     assert loaded is not None
     assert loaded.title == "New Title"
 
+def test_update_fields(storage):
+    story = Story(
+        story_id="fields1",
+        title="Title",
+        url="http://fields.com",
+        date="2025-06-20",
+        source="Test Source",
+        summary="Summary here."
+    )
+    storage.save_story(story)
+    assert storage.update_fields("fields1", filter_status=FilterStatus.passed, filter_reason="ok")
+    loaded = storage.get_story("fields1")
+    assert loaded is not None
+    assert loaded.filter_status == FilterStatus.passed
+    assert loaded.filter_reason == "ok"
+    assert loaded.summary == "Summary here."  # untouched fields are preserved
+    assert not storage.update_fields("missing", filter_reason="ok")
+    with pytest.raises(ValueError):
+        storage.update_fields("fields1", not_a_field="x")
+
 def test_get_all_stories(storage):
     stories = [
         Story(story_id=f"id{i}", title=f"T{i}", url=f"u{i}", date="2025-06-20", source="S")
         for i in range(3)
     ]
-    for s in stories:
-        storage.save_story(s)
+    storage.save_stories(stories)
     all_stories = storage.get_all_stories()
     assert len(all_stories) == 3
     ids = {s.story_id for s in all_stories}
     for s in stories:
         assert s.story_id in ids
+
+def test_get_story_reads_legacy_hash(storage):
+    story = Story(
+        story_id="legacy1",
+        title="Legacy Title",
+        url="http://legacy.com",
+        date="2025-06-20",
+        source="Test Source",
+        post_status=PostStatus.posted
+    )
+    # Stories saved before the msgpack format were hashes of JSON-encoded fields
+    storage.client.hset(
+        "story:legacy1",
+        mapping={k: json.dumps(v) for k, v in story.model_dump(mode="json").items()}
+    )
+    loaded = storage.get_story("legacy1")
+    assert loaded == story
+
+def test_get_all_stories_includes_legacy_hash(storage):
+    storage.save_story(Story(story_id="blob1", title="T", url="u", date="2025-06-20", source="S"))
+    legacy = Story(story_id="legacy2", title="T", url="u", date="2025-06-20", source="S")
+    storage.client.hset("story:legacy2", mapping={k: json.dumps(v) for k, v in legacy.model_dump().items()})
+    ids = {s.story_id for s in storage.get_all_stories()}
+    assert ids == {"blob1", "legacy2"}
@@ -2,324 +2,343 @@
 Tests for the summarizer module.
 """
 
-from unittest.mock import Mock, patch
+import re
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+from openai import OpenAI
+from openai.resources.chat import Chat, Completions
+from openai.resources.models import Models
 
 from summarizer import Summarizer
 from storage import Story
 
+CONFIG = MappingProxyType({"api_key": "test-api-key", "max_length": 300, "retry_count": 2, "model": "gpt-3.5-turbo"})
+# Story fields shared by every single-source test story
+_BASE_STORY = MappingProxyType({"date": "2025-01-15", "source": "Test Source"})
+# Trailing "[source](url)" link; only the bracketed source name counts toward max_length
+_LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)$")
+
+
+def _openai_unavailable(**kwargs):
+    """OpenAI factory that fails the way a missing API key does."""
+    raise KeyError("API key not found")
+
 
-class TestSummarizer:
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.config = {"api_key": "test-api-key", "max_length": 300, "retry_count": 2, "model": "gpt-3.5-turbo"}
-
-    def test_initialization_with_openai(self):
-        """Test summarizer initialization with OpenAI available."""
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_client = Mock()
-            mock_openai_class.return_value = mock_client
-
-            # Mock successful models list call
-            mock_model = Mock()
-            mock_model.id = "gpt-3.5-turbo"
-            mock_models_response = Mock()
-            mock_models_response.data = [mock_model]
-            mock_client.models.list.return_value = mock_models_response
-
-            summarizer = Summarizer(self.config)
-
-            assert summarizer.openai_enabled is True
-            assert summarizer.client == mock_client
-            assert summarizer.max_length == 300
-            assert summarizer.retry_count == 2
-            assert summarizer.model == "gpt-3.5-turbo"
-            mock_openai_class.assert_called_once_with(api_key="test-api-key")
-
-    def test_initialization_without_openai(self):
-        """Test summarizer initialization without OpenAI available."""
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-
-            summarizer = Summarizer(self.config)
-
-            assert summarizer.openai_enabled is False
-            assert summarizer.client is None
-
-    def test_initialization_without_api_key(self):
-        """Test summarizer initialization without API key."""
-        config_no_key = {**self.config}
-        del config_no_key["api_key"]
-
-        summarizer = Summarizer(config_no_key)
-
-        assert summarizer.openai_enabled is False
-        assert summarizer.client is None
-
-    def test_is_video_content(self):
-        """Test video content detection."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            # Video URLs
-            assert summarizer._is_video_content("https://youtube.com/watch?v=123") is True
-            assert summarizer._is_video_content("https://example.com/video/news") is True
-            assert summarizer._is_video_content("https://vimeo.com/123456") is True
-            assert summarizer._is_video_content("https://example.com/player/embed") is True
-
-            # Non-video URLs
-            assert summarizer._is_video_content("https://example.com/article") is False
-            assert summarizer._is_video_content("https://news.com/story") is False
-            assert summarizer._is_video_content("") is False
-
-    def test_summarize_story_video_content(self):
-        """Test summarization for video content."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            story = Story(
-                story_id="test_video",
-                title="Breaking News Video",
-                url="https://youtube.com/watch?v=123",
-                date="2025-01-15",
-                source="Test Source",
-                byline="Test Reporter",
-            )
-
-            summary, used_condensation = summarizer.summarize_story(story)
-
-            expected = "Video: Breaking News Video By Test Reporter. [Test Source](https://youtube.com/watch?v=123)"
-            assert summary == expected
-            assert used_condensation is False
-
-    def test_summarize_story_no_full_text(self):
-        """Test summarization when no full text is available."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            story = Story(
-                story_id="test_no_text",
-                title="Breaking News",
-                url="https://example.com/news",
-                date="2025-01-15",
-                source="Test Source",
-                full_text="",
-            )
-
-            summary, used_condensation = summarizer.summarize_story(story)
-
-            expected = "Breaking News [Test Source](https://example.com/news)"
-            assert summary == expected
-            assert used_condensation is False
-
-    def test_summarize_story_with_byline(self):
-        """Test summarization includes byline correctly."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            story = Story(
-                story_id="test_byline",
-                title="Breaking News",
-                url="https://example.com/news",
-                date="2025-01-15",
-                source="Test Source",
-                byline="John Doe",
-            )
-
-            summary, used_condensation = summarizer.summarize_story(story)
-
-            expected = "Breaking News By John Doe. [Test Source](https://example.com/news)"
-            assert summary == expected
-            assert used_condensation is False
-
-    def test_summarize_story_with_decoded_url(self):
-        """Test summarization uses decoded URL for source link."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            story = Story(
-                story_id="test_decoded",
-                title="Breaking News",
-                url="https://google.com/redirect",
-                decoded_url="https://example.com/real-article",
-                date="2025-01-15",
-                source="Test Source",
-            )
-
-            summary, used_condensation = summarizer.summarize_story(story)
-
-            expected = "Breaking News [Test Source](https://example.com/real-article)"
-            assert summary == expected
-            assert used_condensation is False
-
-    @patch("summarizer.OpenAI")
-    def test_summarize_story_with_openai_success(self, mock_openai_class):
-        """Test successful OpenAI summarization."""
-        # Setup mock OpenAI client
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-
-        # Mock successful models list call
-        mock_model = Mock()
-        mock_model.id = "gpt-3.5-turbo"
-        mock_models_response = Mock()
-        mock_models_response.data = [mock_model]
-        mock_client.models.list.return_value = mock_models_response
-
-        # Mock response
-        mock_response = Mock()
-        mock_message = Mock()
-        mock_message.content = "This is a concise AI-generated summary of the news article."
-        mock_response.choices = [Mock(message=mock_message)]
-        mock_client.chat.completions.create.return_value = mock_response
-
-        summarizer = Summarizer(self.config)
-
-        story = Story(
-            story_id="test_openai",
-            title="Long News Article Title",
-            url="https://example.com/news",
+@lru_cache(maxsize=None)
+def _summarizer_for(config_items):
+    """Build one no-OpenAI Summarizer per distinct config, given as a tuple of (key, value) pairs.
+
+    Cached because, with no client, nothing the tests call changes a Summarizer's state.
+    """
+    return Summarizer(dict(config_items), openai_factory=_openai_unavailable)
+
+
+@pytest.fixture(scope="module")
+def _client_template():
+    """Build the autospec'd OpenAI client mock tree once per module."""
+    client = create_autospec(OpenAI, instance=True)
+    # The resource attributes are cached properties, which autospec does not follow, so spec them explicitly
+    client.chat = create_autospec(Chat, instance=True)
+    client.chat.completions = create_autospec(Completions, instance=True)
+    client.models = create_autospec(Models, instance=True)
+    return client
+
+
+@pytest.fixture
+def openai_client(_client_template, reset_mock_template):
+    """Reset the cached OpenAI client mock to one whose models list includes CONFIG's model."""
+    # Plain attribute holders; only chat.completions.create needs Mock call recording
+    models = SimpleNamespace(data=[SimpleNamespace(id=CONFIG["model"])])
+    return reset_mock_template(_client_template, **{"models.list.return_value": models})
+
+
+@pytest.fixture
+def summarizer_no_openai():
+    """The shared Summarizer for CONFIG with OpenAI unavailable (headline fallback only)."""
+    return _summarizer_for(tuple(sorted(CONFIG.items())))
+
+
+def test_initialization_with_openai(openai_client):
+    """Test summarizer initialization with OpenAI available."""
+    openai_factory = Mock(return_value=openai_client)
+
+    summarizer = Summarizer(CONFIG, openai_factory=openai_factory)
+
+    assert summarizer.openai_enabled is True
+    assert summarizer.client == openai_client
+    assert summarizer.max_length == 300
+    assert summarizer.retry_count == 2
+    assert summarizer.model == "gpt-3.5-turbo"
+    openai_factory.assert_called_once_with(api_key="test-api-key")
+
+
+def test_initialization_without_openai():
+    """Test summarizer initialization without OpenAI available."""
+    openai_factory = Mock(side_effect=KeyError("API key not found"))
+
+    summarizer = Summarizer(CONFIG, openai_factory=openai_factory)
+
+    assert summarizer.openai_enabled is False
+    assert summarizer.client is None
+
+
+def test_initialization_without_api_key():
+    """Test summarizer initialization without API key."""
+    config_no_key = {**CONFIG}
+    del config_no_key["api_key"]
+
+    summarizer = Summarizer(config_no_key)
+
+    assert summarizer.openai_enabled is False
+    assert summarizer.client is None
+
+
+@pytest.mark.parametrize(
+    "url,is_video",
+    [
+        ("https://youtube.com/watch?v=123", True),
+        ("https://example.com/video/news", True),
+        ("https://vimeo.com/123456", True),
+        ("https://example.com/player/embed", True),
+        ("https://example.com/article", False),
+        ("https://news.com/story", False),
+        ("", False),
+    ],
+)
+def test_is_video_content(summarizer_no_openai, url, is_video):
+    """Test video content detection."""
+    assert summarizer_no_openai._is_video_content(url) is is_video
+
+
+@pytest.mark.parametrize(
+    "story_fields,expected",
+    [
+        pytest.param(
+            {
+                "story_id": "test_video",
+                "title": "Breaking News Video",
+                "url": "https://youtube.com/watch?v=123",
+                "byline": "Test Reporter",
+            },
+            "Video: Breaking News Video By Test Reporter. [Test Source](https://youtube.com/watch?v=123)",
+            id="video_content",
+        ),
+        pytest.param(
+            {
+                "story_id": "test_no_text",
+                "title": "Breaking News",
+                "url": "https://example.com/news",
+                "full_text": "",
+            },
+            "Breaking News [Test Source](https://example.com/news)",
+            id="no_full_text",
+        ),
+        pytest.param(
+            {
+                "story_id": "test_byline",
+                "title": "Breaking News",
+                "url": "https://example.com/news",
+                "byline": "John Doe",
+            },
+            "Breaking News By John Doe. [Test Source](https://example.com/news)",
+            id="with_byline",
+        ),
+        pytest.param(
+            {
+                "story_id": "test_decoded",
+                "title": "Breaking News",
+                "url": "https://google.com/redirect",
+                "decoded_url": "https://example.com/real-article",
+            },
+            "Breaking News [Test Source](https://example.com/real-article)",
+            id="with_decoded_url",
+        ),
+    ],
+)
+def test_summarize_story_without_openai(summarizer_no_openai, story_fields, expected):
+    """Test headline/video-prefix summaries, byline and source link formatting without OpenAI."""
+    story = Story(**_BASE_STORY, **story_fields)
+
+    summary, used_condensation = summarizer_no_openai.summarize_story(story)
+
+    assert summary == expected
+    assert used_condensation is False
+
+
+def test_summarize_story_with_openai_success(openai_client):
+    """Test successful OpenAI summarization."""
+    mock_client = openai_client
+
+    message = SimpleNamespace(content="This is a concise AI-generated summary of the news article.")
+    mock_client.chat.completions.create.return_value = SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    summarizer = Summarizer(CONFIG, openai_factory=lambda **kwargs: mock_client)
+
+    story = Story(
+        story_id="test_openai",
+        title="Long News Article Title",
+        url="https://example.com/news",
+        **_BASE_STORY,
+        full_text="This is a very long article with lots of content that needs to be summarized by AI. " * 10,
+    )
+
+    summary, used_condensation = summarizer.summarize_story(story)
+
+    expected = "This is a concise AI-generated summary of the news article. [Test Source](https://example.com/news)"
+    assert summary == expected
+    assert used_condensation is False  # First successful attempt should not use condensation
+
+    # Verify OpenAI was called
+    mock_client.chat.completions.create.assert_called_once()
+    call_args = mock_client.chat.completions.create.call_args
+    assert call_args[1]["model"] == "gpt-3.5-turbo"
+    assert len(call_args[1]["messages"]) == 2
+    assert "system" in call_args[1]["messages"][0]["role"]
+    assert "user" in call_args[1]["messages"][1]["role"]
+
+
+def test_summarize_story_openai_failure_fallback(openai_client):
+    """Test fallback to headline when OpenAI fails."""
+    mock_client = openai_client
+
+    # The models list call succeeds (see openai_client), but then make the chat completion fail
+    mock_client.chat.completions.create.side_effect = Exception("API Error")
+
+    summarizer = Summarizer(CONFIG, openai_factory=lambda **kwargs: mock_client)
+
+    story = Story(
+        story_id="test_openai_fail",
+        title="News Article",
+        url="https://example.com/news",
+        **_BASE_STORY,
+        full_text="This is a long article that should be summarized but will fail.",
+    )
+
+    summary, used_condensation = summarizer.summarize_story(story)
+
+    # Should fallback to headline
+    expected = "News Article [Test Source](https://example.com/news)"
+    assert summary == expected
+    assert used_condensation is False
+
+
+def test_format_final_summary_length_compliance():
+    """Test that final summary respects length limits."""
+    summarizer = _summarizer_for((("max_length", 100),))  # Very short limit
+
+    story = Story(
+        story_id="test_length",
+        title="This is a very long title that would exceed the character limit when combined with byline and source",
+        url="https://example.com/very-long-url-that-adds-more-characters",
+        date="2025-01-15",
+        source="Very Long Source Name",
+        byline="Very Long Reporter Name",
+    )
+
+    # Test with a long summary
+    long_summary = "This is a very long summary that would definitely exceed the character limit."
+    final_summary = summarizer._format_final_summary(long_summary, story)
+
+    # Calculate counted characters (per PRD: summary + byline + source name, not URL)
+    match = _LINK_RE.search(final_summary)
+    if match:
+        source_name = match.group(1)
+        url_start = match.start()
+        summary_without_url = final_summary[:url_start] + f"[{source_name}]"
+        counted_chars = len(summary_without_url)
+    else:
+        counted_chars = len(final_summary)
+
+    assert counted_chars <= 100
+    assert "Very Long Source Name" in final_summary
+    assert "Very Long Reporter Name" in final_summary
+
+
+@pytest.mark.parametrize(
+    "story_fields,expected_summary,expected_stats",
+    [
+        pytest.param(
+            {"story_id": "story1", "title": "News 1", "url": "https://example.com/1", "source": "Source 1"},
+            "News 1 [Source 1](https://example.com/1)",
+            {"summarized": 1, "used_headline": 1, "used_video_prefix": 0},
+            id="headline",
+        ),
+        pytest.param(
+            {
+                "story_id": "story2",
+                "title": "Video News",
+                "url": "https://youtube.com/watch?v=123",
+                "source": "Source 2",
+            },
+            "Video: Video News [Source 2](https://youtube.com/watch?v=123)",
+            {"summarized": 1, "used_headline": 0, "used_video_prefix": 1},
+            id="video_prefix",
+        ),
+        pytest.param(
+            {
+                "story_id": "story3",
+                "title": "News 3",
+                "url": "https://example.com/3",
+                "source": "Source 3",
+                "summary": "Already has summary",  # Should be skipped
+            },
+            "Already has summary",
+            {"summarized": 0, "used_headline": 0, "used_video_prefix": 0},
+            id="already_summarized",
+        ),
+    ],
+)
+def test_summarize_stories_single_story(summarizer_no_openai, story_fields, expected_summary, expected_stats):
+    """Test each summarize_stories branch on a one-story batch."""
+    story = Story(date="2025-01-15", **story_fields)
+
+    updated_stories, stats = summarizer_no_openai.summarize_stories([story])
+
+    assert [s.story_id for s in updated_stories] == [story.story_id]
+    assert updated_stories[0].summary == expected_summary
+    for key, value in expected_stats.items():
+        assert stats[key] == value
+    assert stats["used_openai"] == 0  # OpenAI not available
+    assert stats["failed"] == 0
+
+
+def test_summarize_stories_batch_stats(summarizer_no_openai):
+    """Test batch stats accounting with summarize_story mocked out."""
+    stories = [
+        Story(story_id="story1", title="News 1", url="https://example.com/1", date="2025-01-15", source="Source 1"),
+        Story(
+            story_id="story2",
+            title="Video News",
+            url="https://youtube.com/watch?v=123",
             date="2025-01-15",
-            source="Test Source",
-            full_text="This is a very long article with lots of content that needs to be summarized by AI. " * 10,
-        )
-
-        summary, used_condensation = summarizer.summarize_story(story)
-
-        expected = "This is a concise AI-generated summary of the news article. [Test Source](https://example.com/news)"
-        assert summary == expected
-        assert used_condensation is False  # First successful attempt should not use condensation
-
-        # Verify OpenAI was called
-        mock_client.chat.completions.create.assert_called_once()
-        call_args = mock_client.chat.completions.create.call_args
-        assert call_args[1]["model"] == "gpt-3.5-turbo"
-        assert len(call_args[1]["messages"]) == 2
-        assert "system" in call_args[1]["messages"][0]["role"]
-        assert "user" in call_args[1]["messages"][1]["role"]
-
-    @patch("summarizer.OpenAI")
-    def test_summarize_story_openai_failure_fallback(self, mock_openai_class):
-        """Test fallback to headline when OpenAI fails."""
-        # Setup mock OpenAI client that fails
-        mock_client = Mock()
-        mock_openai_class.return_value = mock_client
-
-        # Mock successful models list call first
-        mock_model = Mock()
-        mock_model.id = "gpt-3.5-turbo"
-        mock_models_response = Mock()
-        mock_models_response.data = [mock_model]
-        mock_client.models.list.return_value = mock_models_response
-
-        # But then make the chat completion fail
-        mock_client.chat.completions.create.side_effect = Exception("API Error")
-
-        summarizer = Summarizer(self.config)
-
-        story = Story(
-            story_id="test_openai_fail",
-            title="News Article",
-            url="https://example.com/news",
+            source="Source 2",
+        ),
+        Story(
+            story_id="story3",
+            title="News 3",
+            url="https://example.com/3",
             date="2025-01-15",
-            source="Test Source",
-            full_text="This is a long article that should be summarized but will fail.",
-        )
-
-        summary, used_condensation = summarizer.summarize_story(story)
-
-        # Should fallback to headline
-        expected = "News Article [Test Source](https://example.com/news)"
-        assert summary == expected
-        assert used_condensation is False
-
-    def test_format_final_summary_length_compliance(self):
-        """Test that final summary respects length limits."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer({"max_length": 100})  # Very short limit
-
-            story = Story(
-                story_id="test_length",
-                title="This is a very long title that would exceed the character limit when combined with byline and source",
-                url="https://example.com/very-long-url-that-adds-more-characters",
-                date="2025-01-15",
-                source="Very Long Source Name",
-                byline="Very Long Reporter Name",
-            )
-
-            # Test with a long summary
-            long_summary = "This is a very long summary that would definitely exceed the character limit."
-            final_summary = summarizer._format_final_summary(long_summary, story)
-
-            # Calculate counted characters (per PRD: summary + byline + source name, not URL)
-            import re
-
-            markdown_link_pattern = r"\[([^\]]+)\]\([^)]+\)$"
-            match = re.search(markdown_link_pattern, final_summary)
-            if match:
-                source_name = match.group(1)
-                url_start = match.start()
-                summary_without_url = final_summary[:url_start] + f"[{source_name}]"
-                counted_chars = len(summary_without_url)
-            else:
-                counted_chars = len(final_summary)
-
-            assert counted_chars <= 100
-            assert "Very Long Source Name" in final_summary
-            assert "Very Long Reporter Name" in final_summary
-
-    def test_summarize_stories_batch(self):
-        """Test batch summarization of multiple stories."""
-        # Mock OpenAI to fail so we can test without it
-        with patch("summarizer.OpenAI") as mock_openai_class:
-            mock_openai_class.side_effect = KeyError("API key not found")
-            summarizer = Summarizer(self.config)
-
-            stories = [
-                Story(
-                    story_id="story1", title="News 1", url="https://example.com/1", date="2025-01-15", source="Source 1"
-                ),
-                Story(
-                    story_id="story2",
-                    title="Video News",
-                    url="https://youtube.com/watch?v=123",
-                    date="2025-01-15",
-                    source="Source 2",
-                ),
-                Story(
-                    story_id="story3",
-                    title="News 3",
-                    url="https://example.com/3",
-                    date="2025-01-15",
-                    source="Source 3",
-                    summary="Already has summary",  # Should be skipped
-                ),
-            ]
-
-            updated_stories, stats = summarizer.summarize_stories(stories)
-
-            assert len(updated_stories) == 3
-            assert stats["total_stories"] == 3
-            assert stats["summarized"] == 2  # One already had summary
-            assert stats["used_headline"] == 1
-            assert stats["used_video_prefix"] == 1
-            assert stats["used_openai"] == 0  # OpenAI not available
-            assert stats["failed"] == 0
-
-            # Check that summaries were generated
-            assert updated_stories[0].summary is not None
-            assert updated_stories[1].summary is not None
-            assert "Video:" in updated_stories[1].summary
-            assert updated_stories[2].summary == "Already has summary"  # Unchanged
+            source="Source 3",
+            summary="Already has summary",  # Should be skipped
+        ),
+    ]
+
+    with patch.object(
+        summarizer_no_openai, "summarize_story", side_effect=[("a", False), ("Video: b", False)]
+    ) as mock_summarize:
+        updated_stories, stats = summarizer_no_openai.summarize_stories(stories)
+
+    assert mock_summarize.call_count == 2  # One already had summary
+    assert len(updated_stories) == 3
+    assert stats == {
+        "total_stories": 3,
+        "summarized": 2,
+        "used_openai": 0,
+        "used_condensation": 0,
+        "used_headline": 1,
+        "used_video_prefix": 1,
+        "failed": 0,
+    }